@@ -2,23 +2,327 @@
 
 Each Tile is initiated after minefield generation and field value calculation.
 
-Each Tile holds its own state, location, value and references to neighbouring
-Tiles.
+Game logic is held by MineField independently of tkinter. Field values,
+covered and flagged fields are kept as one array per property. Each Tile holds
+only its location and the canvas item displaying it.
 
-User triggered Tile uncovering is handled by Tile method.
+User triggered uncovering is computed by MineField on field coordinates and
+applied to the Tiles by Minesweeper in a single pass.
 
 """
 # %%
 import tkinter as tk
-from PIL import Image, ImageTk
-from random import randrange
+from PIL import Image
+from random import sample
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+import weakref
+import io
+
+ICON_DIR = Path("Minesweeper icons")  # minesweeper icon directory
+COVERED = 10  # Tile state code of a covered field
+FLAGGED = 11  # Tile state code of a flagged field
+ICON_FILES = {COVERED: "facingDown.png", FLAGGED: "flagged.png",
+              9: "bomb.png"}
+ICON_FILES.update({i: f"{i}.png" for i in range(9)})
+
+TILE_SIZE = 50  # Tile size in pixels
+# PhotoImage cache keyed by (state, size), entries live as long as a board
+# holds them in its photo table
+PHOTO_CACHE = weakref.WeakValueDictionary()
+RESIZED = {}  # resized icon PNG data cache keyed by (state, size)
+STATES = tuple(range(FLAGGED + 1))  # Tile state codes in photo table order
+# offsets of the fields a zero value region spreads to
+NEIGHBOURS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+@lru_cache(maxsize=None)
+def _load_icon(state):
+    """Open and decode the minesweeper icon of given state on first use."""
+    icon = Image.open(ICON_DIR / ICON_FILES[state])
+    icon.load()  # decode now instead of on first resize
+    return icon
+
+
+def _get_photo(state, size=None):
+    """Return the cached PhotoImage of the icon for given state and size."""
+    key = (state, size)
+    photo = PHOTO_CACHE.get(key)
+    if photo is None:
+        data = RESIZED.get(key)
+        if data is None:
+            bitmap = _load_icon(state)
+            # icons already of the requested size are used as they are
+            if size is not None and bitmap.size != (size, size):
+                bitmap = bitmap.resize((size, size), Image.NEAREST)
+            buffer = io.BytesIO()
+            bitmap.save(buffer, 'PNG')
+            data = RESIZED[key] = buffer.getvalue()
+        photo = tk.PhotoImage(data=data)
+        PHOTO_CACHE[key] = photo
+    return photo
+
+
+# %%
+
+
+def calculate_values(minefield):
+    """Calculate values of each field from the minefield.
+
+    Neighbouring mines are counted with a 3x3 box sum over the minefield done
+    SIMD within a register (SWAR). Each row is packed into a single int with
+    one byte per field, so shifting and adding packed rows sums whole rows at
+    once. Sums never exceed 9, so no carry crosses into a neighbouring field.
+    Mines are given the value 9.
+
+    Args:
+        minefield (list of bytearray): 0 (empty fields) and 1 (mines).
+
+    Returns:
+        list of bytearray: Value of each field.
+
+    """
+    if not minefield:
+        return []
+    y = len(minefield[0])
+    full = (1 << 8 * y) - 1  # every field byte set to 0xFF
+    rows = [int.from_bytes(line, 'big') for line in minefield]
+
+    # horizontal pass: each field summed with its left and right fields
+    sums = [(row + (row << 8) + (row >> 8)) & full for row in rows]
+
+    # vertical pass: each row summed with the rows above and below
+    sums = [0] + sums + [0]
+    values = []
+    for above, row, below, mines in zip(sums, sums[1:], sums[2:], rows):
+        total = ((above + row + below) & ~(mines * 0xFF)) | mines * 9
+        values.append(bytearray(total.to_bytes(y, 'big')))
+    return values
+
+
+def label_regions(state):
+    """Label connected regions of zero value fields.
+
+    Uncovering any field of a zero value region uncovers the whole region
+    together with its bordering non-zero fields. Regions are labelled once per
+    minefield so that uncovering a field only has to look its region up.
+
+    Args:
+        state (list of bytearray): Value of each field.
+
+    Returns:
+        tuple: labels (list of lists of int) holding the region number of each
+            zero value field and 0 for other fields, and regions (list of
+            lists of tuple of int) holding at index n - 1 coordinates of all
+            fields uncovered with region number n.
+
+    """
+    x = len(state)
+    y = len(state[0]) if x else 0
+    labels = [y * [0] for _ in range(x)]
+    # last region each bordering non-zero field has been added to
+    border = [y * [0] for _ in range(x)]
+    regions = []
+    for i in range(x):
+        for j in range(y):
+            if state[i][j] != 0 or labels[i][j]:
+                continue
+            region = len(regions) + 1
+            labels[i][j] = region
+            fields = [(i, j)]
+            queue = deque([(i, j)])
+            while queue:
+                a, b = queue.popleft()
+                for da, db in NEIGHBOURS:
+                    c, d = a + da, b + db
+                    if 0 <= c < x and 0 <= d < y:
+                        value = state[c][d]
+                        if value == 0:
+                            if not labels[c][d]:
+                                labels[c][d] = region
+                                fields.append((c, d))
+                                queue.append((c, d))
+                        elif value != 9 and border[c][d] != region:
+                            border[c][d] = region
+                            fields.append((c, d))
+            regions.append(fields)
+    return labels, regions
+
+
+# %%
+
+
+class MineField:
+    """Minesweeper game logic independent of tkinter.
+
+    Holds the minefield and the state of every field as one array per
+    property and works out which fields are uncovered by a move. Displaying
+    the uncovered fields is left to the caller.
+
+    The minefield starts without mines. Mines are placed and field values
+    calculated by place_mines, which has to be called before any field is
+    revealed.
+
+    Args:
+        x (int): Vertical size of minefield.
+        y (int): Horizontal size of minefield.
+        z (int): Number of mines.
+        debug (bool): Debug flag. Defaults to False.
+
+    Attributes:
+        x (int): Vertical size of minefield.
+        y (int): Horizontal size of minefield.
+        z (int): Number of mines.
+        debug (bool): Debug flag. Defaults to False.
+        force_empty (tuple of tuple of int): Coordinates of fields kept free
+            of mines by place_mines.
+        minefield (list of bytearray): Representation of minesweeper board
+            containing 0 (empty fields) and 1 (mines).
+        state (list of bytearray): Value of each field, number of
+            neighbouring mines (0-8) or 9 for mines.
+        cov (list of bytearray): 1 for covered fields, 0 for uncovered.
+        flagged (list of bytearray): 1 for flagged fields, 0 otherwise.
+        labels (list of lists of int): Zero value region number of each
+            field, 0 for non-zero fields. None until mines are placed.
+        regions (list of lists of tuple of int): Coordinates of fields
+            uncovered with each zero value region. None until mines are
+            placed.
+
+    Raises:
+        TypeError: If given values do not match their expected types.
+        ValueError: If z is not between 0 and the number of fields.
+
+    """
+
+    __slots__ = ('x', 'y', 'z', 'debug', 'force_empty', 'minefield', 'state',
+                 'cov', 'flagged', 'labels', 'regions')
+
+    def __init__(self, x, y, z, debug=False):
+        if not isinstance(x, int):
+            raise TypeError('x should be of type int')
+        if not isinstance(y, int):
+            raise TypeError('y should be of type int')
+        if not isinstance(z, int):
+            raise TypeError('z should be of type int')
+        if not isinstance(debug, bool):
+            raise TypeError('debug should be of type bool')
+        if not 0 <= z <= x * y:
+            raise ValueError('z should be between 0 and the number of fields')
+        self.x = x
+        self.y = y
+        self.z = z
+        self.debug = debug
+        self.force_empty = ()
+        # mine-free minefield until place_mines is called
+        self.minefield = [bytearray(self.y) for _ in range(self.x)]
+        self.state = [bytearray(self.y) for _ in range(self.x)]
+        self.labels = None
+        self.regions = None
+        self.cov = [bytearray(b'\x01' * self.y) for _ in range(self.x)]
+        self.flagged = [bytearray(self.y) for _ in range(self.x)]
+
+    def __repr__(self):
+        minefield = [list(line) for line in self.minefield]
+        return (f"{{'x':{self.x}, 'y':{self.y}, 'z':{self.z}, "
+                f"'debug':{self.debug}, 'minefield':{minefield}}}")
+
+    def place_mines(self, force_empty=()):
+        """Place mines and calculate values of each field.
+
+        Args:
+            force_empty (tuple of tuple of int): Coordinates of fields that
+                must not contain a mine. Defaults to no fields.
+
+        Raises:
+            TypeError: If force_empty is not a tuple.
+            ValueError: If a field of force_empty is outside of the minefield
+                or z does not fit the fields not forced to be empty.
+
+        """
+        if not isinstance(force_empty, tuple):
+            raise TypeError('force_empty should be of type tuple')
+        for i, j in force_empty:
+            if not (0 <= i < self.x and 0 <= j < self.y):
+                raise ValueError(f'force_empty field {(i, j)} is outside '
+                                 'of the minefield')
+        forbidden = {i * self.y + j for i, j in force_empty}
+        if self.z > self.x * self.y - len(forbidden):
+            raise ValueError('z should not exceed the number of fields not '
+                             'forced to be empty')
+        self.force_empty = force_empty
+        self._generate_minefield(forbidden)
+        self._calculate_values()
+
+    def _generate_minefield(self, forbidden):
+        """Fill the empty minefield with mines.
+
+        Args:
+            forbidden (set of int): Flat indexes of fields that must not
+                contain a mine.
+
+        """
+        # generation of empty minefield, one byte per field
+        self.minefield = [bytearray(self.y) for _ in range(self.x)]
+
+        # addition of mines to the minefield at distinct random fields
+        indexes = sample(range(self.x * self.y), self.z + len(forbidden))
+        if forbidden:
+            # dropping fields forced to be empty from a random sample
+            # enlarged by their number keeps the mines uniformly placed
+            indexes = [index for index in indexes
+                       if index not in forbidden][:self.z]
+        for index in indexes:
+            self.minefield[index // self.y][index % self.y] = 1
+        if self.debug:
+            print("0/1 minefield representation:\n")
+            for line in self.minefield:
+                print(list(line))
+
+    def _calculate_values(self):
+        """Calculate values of each field from the minefield."""
+        self.state = calculate_values(self.minefield)
+        self.labels, self.regions = label_regions(self.state)
+        if self.debug:
+            print("\nMinefield with calculated values:\n")
+            for line in self.state:
+                print(list(line))
+
+    def reveal(self, i, j):
+        """Uncover field and its whole region if it is a zero value field.
+
+        Args:
+            i (int): x coordinate of the uncovered field.
+            j (int): y coordinate of the uncovered field.
+
+        Returns:
+            list of tuple of int: Coordinates of newly uncovered fields.
+
+        """
+        region = self.labels[i][j]
+        fields = self.regions[region - 1] if region else [(i, j)]
+        uncovered = []
+        for a, b in fields:
+            if self.cov[a][b]:
+                self.cov[a][b] = 0
+                uncovered.append((a, b))
+        return uncovered
+
+    def reveal_all(self):
+        """Uncover all covered fields.
+
+        Returns:
+            list of tuple of int: Coordinates of newly uncovered fields.
+
+        """
+        uncovered = []
+        for i, row_cov in enumerate(self.cov):
+            for j in range(self.y):
+                if row_cov[j]:
+                    row_cov[j] = 0
+                    uncovered.append((i, j))
+        return uncovered
 
-ICON = {}  # minesweeper icon dictionary
-ICON['c'] = Image.open("Minesweeper icons\\facingDown.png")
-ICON['f'] = Image.open("Minesweeper icons\\flagged.png")
-for i in range(9):
-    ICON[i] = Image.open("Minesweeper icons\\" + str(i) + ".png")
-ICON[9] = Image.open("Minesweeper icons\\bomb.png")
 
 # %%
 
@@ -26,429 +330,108 @@ ICON[9] = Image.open("Minesweeper icons\\bomb.png")
 class Tile:
     """A single tile on the board.
 
+    The Tile only displays a field of the board. Field state is read from and
+    written to the arrays of the MineField of the Minesweeper board it belongs
+    to.
+
     TODO When field is flagged, field should not be uncoverable.
 
     Args:
-        parent (tk.Frame): Parent Frame of Tile.
+        board (Minesweeper): Minesweeper board the Tile belongs to.
         x (int): x coordinate.
         y (int): y coordinate.
-        state (int): State of the given Tile 0 (empty) or 1 (mine).
-        cov (bool): Defaults to True if Tile is covered False overwise.
-        size (int): Size of Tile in pixels. Defaults to None.
 
     Attributes:
-        parent (tk.Frame): Parent Frame of Tile.
+        board (Minesweeper): Minesweeper board the Tile belongs to.
         x (int): x coordinate.
         y (int): y coordinate.
-        state (int): State of the given Tile 0 (empty) or 1 (mine).
-        cov (bool): Defaults to True if Tile is covered False overwise.
-        size (int): Size of Tile in pixels. Defaults to None.
-        flagged (bool): False if Tile not flagged, True if flagged.
-        triggered (bool): False if Tile not triggered, True if triggered.
-        tmp_calc (bool): False if temporary Tile state values haven't been
-            calculated.
-        final_calc (bool): False if final Tile state values haven't been
-            calculated.
+        state (int): Value of the field 0-8 (neighbouring mines) or 9 (mine),
+            stored in the board field state array.
+        cov (bool): True if field is covered, stored in the board field cov
+            array.
+        flagged (bool): True if field is flagged, stored in the board field
+            flagged array.
+        item (int): Board canvas image item displaying the Tile, created once
+            and reconfigured on every state switch.
 
     Raises:
-        TypeError: If given values do not match their expected types.
+        TypeError: If given values do not match their expected types. Not
+            checked when running with python -O.
 
     """
 
-    def __init__(self, parent, x, y, state, cov=True, size=None):
-        self.parent = parent
+    __slots__ = ('board', 'x', 'y', 'item', 'bitmap')
+
+    def __init__(self, board, x, y):
+        if __debug__:
+            if not isinstance(board, Minesweeper):
+                raise TypeError('board should be of type Minesweeper')
+            if not isinstance(x, int):
+                raise TypeError('x should be of type int')
+            if not isinstance(y, int):
+                raise TypeError('y should be of type int')
+        self.board = board
         self.x = x
         self.y = y
-        self.state = state
-        self.cov = cov
-        if size is None:
-            self._size = size
-        else:
-            self.size = size
-        if self.cov:
-            self._update('c')
-        else:
-            self._update(self.state)
-        # surrounding Tile pointers
-        self._top_tile = None
-        self._bottom_tile = None
-        self._left_tile = None
-        self._right_tile = None
-        self._top_left_tile = None
-        self._top_right_tile = None
-        self._bottom_left_tile = None
-        self._bottom_right_tile = None
-        # flags
-        self.flagged = False
-        self.triggered = False
-        self.tmp_calc = False
-        self.final_calc = False
+        self.item = self.board.canvas.create_image(self.y * TILE_SIZE,
+                                                   self.x * TILE_SIZE,
+                                                   anchor='nw')
+        self._update(COVERED)
 
     def __repr__(self):
-        txt = "{"
-        txt += f"'x':{self.x}, "
-        txt += f"'y':{self.y}, "
-        txt += f"'state':{self.state}, "
-        txt += f"'cov':{self.cov}, "
-        txt += f"'size':{self.size}"
-        txt += "}"
-        return txt
+        return (f"{{'x':{self.x}, 'y':{self.y}, "
+                f"'state':{self.state}, 'cov':{self.cov}}}")
 
     def switch(self, state):
         """Switch state of Tile."""
-        self.button.destroy()
         self._update(state)
 
     def _update(self, state):
-        """Initialize Tile with current parameters."""
-        bitmap = ICON.get(state)
-        if self.size is not None:
-            bitmap = bitmap.resize((self.size, self.size))
-        self.bitmap = ImageTk.PhotoImage(image=bitmap)
-        self.button = tk.Button(master=self.parent, image=self.bitmap)
-        self.button.bind("<ButtonPress-1><ButtonRelease-1>", self.left_click)
-        self.button.bind("<ButtonPress-3><ButtonRelease-3>", self.right_click)
-        self.grid()
+        """Swap the image displayed by the Tile canvas item."""
+        self.bitmap = self.board.photo_table[state]
+        self.board.canvas.itemconfigure(self.item, image=self.bitmap)
 
     def left_click(self, event):
         """Uncover Tile."""
         if self.cov:
             if self.state == 9:
-                self._uncover_all()
+                self.board.uncover_all()
             else:
-                self._uncover()
+                self.board.uncover(self.x, self.y)
 
     def right_click(self, event):
         """Flag Tile."""
         if self.cov:
             if not self.flagged:
-                self.switch('f')
+                self.switch(FLAGGED)
                 self.flagged = True
             else:
-                self.switch('c')
+                self.switch(COVERED)
                 self.flagged = False
 
-    def _uncover_all(self):
-        """Recursive uncover of all Tiles.
-
-        BUG Partial uncover: when triggered mine is on isolated island
-        surrounded by uncovered Tiles.
-
-        NOTE Solution separate out triggered flag from cov so that _uncover_all
-        can traverse uncovered Tiles.
-
-        ISSUE SOLVED
-
-        """
-        if not self.triggered:
-            self.switch(self.state)
-            self.cov = False
-            self.triggered = True
-            # uncover surrounding Tiles if their cov = True
-            # top_tile
-            if self.top_tile is not None:
-                self.top_tile._uncover_all()
-            # bottom_tile
-            if self.bottom_tile is not None:
-                self.bottom_tile._uncover_all()
-            # left_tile
-            if self.left_tile is not None:
-                self.left_tile._uncover_all()
-            # right_tile
-            if self.right_tile is not None:
-                self.right_tile._uncover_all()
-
-    def _uncover(self):
-        """Recursive uncover of zero value and surrounding Tiles.
-
-        NOTE cov conditions could be limited down to one location.
-
-        SOLVED
-
-        """
-        if self.cov:
-            self.switch(self.state)
-            self.cov = False
-            if self.state == 0:
-                # recursively check bordering Tiles
-                # uncover and continue or leave
-                # top_tile
-                if self.top_tile is not None:
-                    if self.top_tile.state == 0:
-                        self.top_tile._uncover()
-                    elif self.top_tile.state != 9:
-                        self.top_tile.switch(self.top_tile.state)
-                        self.top_tile.cov = False
-                # bottom_tile
-                if self.bottom_tile is not None:
-                    if self.bottom_tile.state == 0:
-                        self.bottom_tile._uncover()
-                    elif self.bottom_tile.state != 9:
-                        self.bottom_tile.switch(self.bottom_tile.state)
-                        self.bottom_tile.cov = False
-                # left_tile
-                if self.left_tile is not None:
-                    if self.left_tile.state == 0:
-                        self.left_tile._uncover()
-                    elif self.left_tile.state != 9:
-                        self.left_tile.switch(self.left_tile.state)
-                        self.left_tile.cov = False
-                # right_tile
-                if self.right_tile is not None:
-                    if self.right_tile.state == 0:
-                        self.right_tile._uncover()
-                    elif self.right_tile.state != 9:
-                        self.right_tile.switch(self.right_tile.state)
-                        self.right_tile.cov = False
-
-    def _value(self):
-        """Method for calculating transitioning field state values.
-
-        Original values 0 or 1.
-
-        Calculated values (0-9) projected onto transitional range (10-19).
-
-        """
-        value = 0
-        if self.state == 1:
-            value = 9
-        else:
-            if self.top_tile is not None:
-                if self.top_tile.state in (0, 1):
-                    value += self.top_tile.state
-                elif self.top_tile.state == 19:
-                    value += 1
-            if self.bottom_tile is not None:
-                if self.bottom_tile.state in (0, 1):
-                    value += self.bottom_tile.state
-                elif self.bottom_tile.state == 19:
-                    value += 1
-            if self.left_tile is not None:
-                if self.left_tile.state in (0, 1):
-                    value += self.left_tile.state
-                elif self.left_tile.state == 19:
-                    value += 1
-            if self.right_tile is not None:
-                if self.right_tile.state in (0, 1):
-                    value += self.right_tile.state
-                elif self.right_tile.state == 19:
-                    value += 1
-            if self.top_left_tile is not None:
-                if self.top_left_tile.state in (0, 1):
-                    value += self.top_left_tile.state
-                elif self.top_left_tile.state == 19:
-                    value += 1
-            if self.top_right_tile is not None:
-                if self.top_right_tile.state in (0, 1):
-                    value += self.top_right_tile.state
-                elif self.top_right_tile.state == 19:
-                    value += 1
-            if self.bottom_left_tile is not None:
-                if self.bottom_left_tile.state in (0, 1):
-                    value += self.bottom_left_tile.state
-                elif self.bottom_left_tile.state == 19:
-                    value += 1
-            if self.bottom_right_tile is not None:
-                if self.bottom_right_tile.state in (0, 1):
-                    value += self.bottom_right_tile.state
-                elif self.bottom_right_tile.state == 19:
-                    value += 1
-        return value + 10
-
-    def calculate_values(self):
-        """In-place field value calculation.
-
-        NOTE reason why original commented final value calculation failed.
-
-        """
-        self.tmp_value_calc()
-        self.final_value_calc()
-        # if not self.final_calc:
-        #     self.state -= 10
-        #     self.final_calc = True
-
-    def tmp_value_calc(self):
-        """Transitional value calculation."""
-        if not self.tmp_calc:
-            self.state = self._value()
-            self.tmp_calc = True
-            # recursively check bordering Tiles calculate their
-            # transitional state value and continue
-            # top_tile
-            if self.top_tile is not None:
-                self.top_tile.tmp_value_calc()
-            # bottom_tile
-            if self.bottom_tile is not None:
-                self.bottom_tile.tmp_value_calc()
-            # left_tile
-            if self.left_tile is not None:
-                self.left_tile.tmp_value_calc()
-            # right_tile
-            if self.right_tile is not None:
-                self.right_tile.tmp_value_calc()
-
-    def final_value_calc(self):
-        """Final value calculation."""
-        if not self.final_calc:
-            self.state -= 10
-            self.final_calc = True
-            # recursively check bordering Tiles calculate their
-            # final state value and continue
-            # top_tile
-            if self.top_tile is not None:
-                self.top_tile.final_value_calc()
-            # bottom_tile
-            if self.bottom_tile is not None:
-                self.bottom_tile.final_value_calc()
-            # left_tile
-            if self.left_tile is not None:
-                self.left_tile.final_value_calc()
-            # right_tile
-            if self.right_tile is not None:
-                self.right_tile.final_value_calc()
-
-    def grid(self, *args, **kwargs):
-        self.button.grid(row=self.x, column=self.y, *args, **kwargs)
-
-    @property
-    def parent(self):
-        return self._parent
-
-    @parent.setter
-    def parent(self, parent):
-        if not isinstance(parent, tk.Frame):
-            raise TypeError('parent should be of type tkinter.Frame')
-        self._parent = parent
-
-    @property
-    def x(self):
-        return self._x
-
-    @x.setter
-    def x(self, x):
-        if not isinstance(x, int):
-            raise TypeError('x should be of type int')
-        self._x = x
-
-    @property
-    def y(self):
-        return self._y
-
-    @y.setter
-    def y(self, y):
-        if not isinstance(y, int):
-            raise TypeError('y should be of type int')
-        self._y = y
-
     @property
     def state(self):
-        return self._state
+        return self.board.field.state[self.x][self.y]
 
     @state.setter
     def state(self, state):
-        if not isinstance(state, int):
-            raise TypeError('state should be of type int')
-        self._state = state
+        self.board.field.state[self.x][self.y] = state
 
     @property
     def cov(self):
-        return self._cov
+        return bool(self.board.field.cov[self.x][self.y])
 
     @cov.setter
     def cov(self, cov):
-        if not isinstance(cov, bool):
-            raise TypeError('cov should be of type bool')
-        self._cov = cov
-
-    @property
-    def size(self):
-        return self._size
-
-    @size.setter
-    def size(self, size):
-        if not isinstance(size, int):
-            raise TypeError('size should be of type int')
-        self._size = size
-
-    @property
-    def top_tile(self):
-        return self._top_tile
-
-    @top_tile.setter
-    def top_tile(self, top_tile):
-        if not isinstance(top_tile, Tile):
-            raise TypeError('top_tile should be of type Tile')
-        self._top_tile = top_tile
-
-    @property
-    def bottom_tile(self):
-        return self._bottom_tile
-
-    @bottom_tile.setter
-    def bottom_tile(self, bottom_tile):
-        if not isinstance(bottom_tile, Tile):
-            raise TypeError('bottom_tile should be of type Tile')
-        self._bottom_tile = bottom_tile
-
-    @property
-    def left_tile(self):
-        return self._left_tile
-
-    @left_tile.setter
-    def left_tile(self, left_tile):
-        if not isinstance(left_tile, Tile):
-            raise TypeError('left_tile should be of type Tile')
-        self._left_tile = left_tile
-
-    @property
-    def right_tile(self):
-        return self._right_tile
-
-    @right_tile.setter
-    def right_tile(self, right_tile):
-        if not isinstance(right_tile, Tile):
-            raise TypeError('right_tile should be of type Tile')
-        self._right_tile = right_tile
+        self.board.field.cov[self.x][self.y] = cov
 
     @property
-    def top_left_tile(self):
-        return self._top_left_tile
-
-    @top_left_tile.setter
-    def top_left_tile(self, top_left_tile):
-        if not isinstance(top_left_tile, Tile):
-            raise TypeError('top_left_tile should be of type Tile')
-        self._top_left_tile = top_left_tile
+    def flagged(self):
+        return bool(self.board.field.flagged[self.x][self.y])
 
-    @property
-    def top_right_tile(self):
-        return self._top_right_tile
-
-    @top_right_tile.setter
-    def top_right_tile(self, top_right_tile):
-        if not isinstance(top_right_tile, Tile):
-            raise TypeError('top_right_tile should be of type Tile')
-        self._top_right_tile = top_right_tile
-
-    @property
-    def bottom_left_tile(self):
-        return self._bottom_left_tile
-
-    @bottom_left_tile.setter
-    def bottom_left_tile(self, bottom_left_tile):
-        if not isinstance(bottom_left_tile, Tile):
-            raise TypeError('bottom_left_tile should be of type Tile')
-        self._bottom_left_tile = bottom_left_tile
-
-    @property
-    def bottom_right_tile(self):
-        return self._bottom_right_tile
-
-    @bottom_right_tile.setter
-    def bottom_right_tile(self, bottom_right_tile):
-        if not isinstance(bottom_right_tile, Tile):
-            raise TypeError('bottom_right_tile should be of type Tile')
-        self._bottom_right_tile = bottom_right_tile
+    @flagged.setter
+    def flagged(self, flagged):
+        self.board.field.flagged[self.x][self.y] = flagged
 
 
 # %%
@@ -468,6 +451,9 @@ class Minesweeper:
 
     TODO 1) Main frame, subframes and Tile resizing.
     TODO 2) Force first Tile to be uncovered to be empty.
+
+    NOTE Modification applied.
+
     TODO 3) Play, win and lose self resizing, and self repositioning frames.
     TODO 4) Interactive only when no active game score frame controls.
     TODO 5) Auto updated status frame values.
@@ -509,213 +495,149 @@ class Minesweeper:
             including number of games played, number of losses and number of
             wins.
         board_frame (tk.Frame): Subframe containing Minesweeper board.
+        photo_table (tuple of tk.PhotoImage): Icons resized to TILE_SIZE
+            indexed by the Tile state code.
+        canvas (tk.Canvas): Canvas within board_frame on which all Tiles are
+            drawn and which receives all mouse clicks on the board.
         status_frame (tk.Frame): Subframe containing game status including
             current board size and number of mines.
-        minefield (list of lists of int): Representation of minesweeper board
-            containing 0 (empty fields) and 1 (mines).
-        board (list of lists of Tile): Contains Tiles which make up the
+        field (MineField): Game logic holding the minefield and the state of
+            every field.
+        board (list of lists of Tile): Contains Tiles which display the
             minesweeper board.
+        started (bool): True once the first field has been uncovered.
+
+    Raises:
+        TypeError: If given values do not match their expected types.
 
     """
 
     def __init__(self, parent, x, y, z, debug=False):
+        if not isinstance(parent, (tk.Tk, tk.Frame)):
+            msg = 'parent should be of type tkinter.Tk or tkinter.Frame'
+            raise TypeError(msg)
         self.parent = parent
+        self.field = MineField(x, y, z, debug)  # mines placed by _start
         self.x = x
         self.y = y
         self.z = z
         self.debug = debug
+        self.started = False
         self.main_frame = tk.Frame(self.parent)
         self.score_frame = tk.Frame(self.main_frame)
         self.board_frame = tk.Frame(self.main_frame)
         self.status_frame = tk.Frame(self.main_frame)
-        self._generate_minefield()
+        self.photo_table = tuple(_get_photo(state, TILE_SIZE)
+                                 for state in STATES)
         self._init_tiles()
-        self._link_tiles()
-
-    def __repr__(self):
-        txt = "{"
-        txt += f"'x':{self.x}, "
-        txt += f"'y':{self.y}, "
-        txt += f"'z':{self.z}, "
-        txt += f"'debug':{self.debug}, "
-        txt += f"'minefield':{self.minefield}"
-        txt += "}"
-        return txt
-
-    def _generate_minefield(self):
-        """Generate and fill empty minefield."""
-        self.minefield = []
-
-        # generation of empty minefield
-        for _ in range(self.x):
-            self.minefield.append(self.y * [0])
-
-        # addition of mines to the minefield
-        j = 0
-        while j < self.z:
-            a = randrange(1, self.x)
-            b = randrange(1, self.y)
-            if self.minefield[a][b] == 0:
-                self.minefield[a][b] = 1
-                j += 1
-        if self.debug:
-            print("0/1 minefield representation:\n")
-            for line in self.minefield:
-                print(line)
-
-    def _init_tiles(self):
-        """Tile initialization.
-
-        NOTE Empty minefield generation and selection of mine locations could
-        be integrated into Tile initialization.
-
-        """
-        self.board = [self.y * [0] for _ in range(self.x)]
-        for i in range(self.x):
-            for j in range(self.y):
-                self.board[i][j] = Tile(self.board_frame, i, j,
-                                        self.minefield[i][j], size=50)
-
-    def _link_tiles(self):
-        """Tile linking."""
-        # Horizontal linking
-        for i in range(self.x):
-            for j in range(self.y-1):
-                self.board[i][j].right_tile = self.board[i][j + 1]
-                self.board[i][j + 1].left_tile = self.board[i][j]
-
-        # Vertical linking
-        for i in range(self.x-1):
-            for j in range(self.y):
-                self.board[i][j].bottom_tile = self.board[i + 1][j]
-                self.board[i + 1][j].top_tile = self.board[i][j]
-
-        # Bottom-Right and Top-Left cross linking
-        for i in range(self.x-1):
-            for j in range(self.y-1):
-                self.board[i][j].bottom_right_tile = self.board[i + 1][j + 1]
-                self.board[i + 1][j + 1].top_left_tile = self.board[i][j]
-
-        # Bottom-Left and Top-Right cross linking
-        for i in range(1, self.x):
-            for j in range(self.y-1):
-                self.board[i][j].bottom_left_tile = self.board[i - 1][j + 1]
-                self.board[i - 1][j + 1].top_right_tile = self.board[i][j]
-
-        # Calculation of values for each field
-        self.board[0][0].calculate_values()
-        if self.debug:
-            print("\nMinefield with calculated values:\n")
-            for line in self.board:
-                print([i.state for i in line])
         self.score_frame.pack(side='top')
         self.board_frame.pack(side='top')
         self.status_frame.pack(side='top')
 
-    def pack(self, *args, **kwargs):
-        self.main_frame.pack(*args, **kwargs)
-
-    def grid(self, *args, **kwargs):
-        self.main_frame.grid(*args, **kwargs)
-
-    @property
-    def parent(self):
-        return self._parent
-
-    @parent.setter
-    def parent(self, parent):
-        if not isinstance(parent, (tk.Tk, tk.Frame)):
-            msg = 'parent should be of type tkinter.Tk or tkinter.Frame'
-            raise TypeError(msg)
-        self._parent = parent
-
-    @property
-    def x(self):
-        return self._x
-
-    @x.setter
-    def x(self, x):
-        if not isinstance(x, int):
-            raise TypeError('x should be of type int')
-        self._x = x
-
-    @property
-    def y(self):
-        return self._y
-
-    @y.setter
-    def y(self, y):
-        if not isinstance(y, int):
-            raise TypeError('y should be of type int')
-        self._y = y
-
-    @property
-    def z(self):
-        return self._z
-
-    @z.setter
-    def z(self, z):
-        if not isinstance(z, int):
-            raise TypeError('z should be of type int')
-        self._z = z
-
-    @property
-    def debug(self):
-        return self._debug
+    def __repr__(self):
+        minefield = [list(line) for line in self.field.minefield]
+        return (f"{{'x':{self.x}, 'y':{self.y}, 'z':{self.z}, "
+                f"'debug':{self.debug}, 'minefield':{minefield}}}")
 
-    @debug.setter
-    def debug(self, debug):
-        if not isinstance(debug, bool):
-            raise TypeError('debug should be of type bool')
-        self._debug = debug
+    def _init_tiles(self):
+        """Tile initialization."""
+        self.canvas = tk.Canvas(self.board_frame, width=self.y * TILE_SIZE,
+                                height=self.x * TILE_SIZE,
+                                highlightthickness=0)
+        self.canvas.bind("<ButtonPress-1><ButtonRelease-1>", self._left_click)
+        self.canvas.bind("<ButtonPress-3><ButtonRelease-3>", self._right_click)
+        self.board = [[Tile(self, i, j) for j in range(self.y)]
+                      for i in range(self.x)]
+        # pack only once all Tile items exist
+        self.canvas.pack()
+
+    def uncover(self, i, j):
+        """Uncover field and its whole region if it is a zero value field.
+
+        Tiles are redrawn in one batch when Tk is next idle.
+
+        Args:
+            i (int): x coordinate of the uncovered field.
+            j (int): y coordinate of the uncovered field.
 
-    @property
-    def main_frame(self):
-        return self._main_frame
+        """
+        self.canvas.after_idle(self._display, self.field.reveal(i, j))
+
+    def _tile_at(self, event):
+        """Return the Tile under the mouse pointer or None."""
+        i = event.y // TILE_SIZE
+        j = event.x // TILE_SIZE
+        if 0 <= i < self.x and 0 <= j < self.y:
+            return self.board[i][j]
+        return None
+
+    def _left_click(self, event):
+        """Dispatch left click on the board canvas to the clicked Tile."""
+        tile = self._tile_at(event)
+        if tile is not None:
+            if not self.started:
+                self._start(tile.x, tile.y)
+            tile.left_click(event)
+
+    def _start(self, i, j):
+        """Place the mines so that the first uncovered field is empty.
+
+        The first uncovered field and its neighbours are kept free of mines
+        when the number of mines leaves room for it, otherwise only the field
+        itself.
+
+        Args:
+            i (int): x coordinate of the first uncovered field.
+            j (int): y coordinate of the first uncovered field.
 
-    @main_frame.setter
-    def main_frame(self, main_frame):
-        if not isinstance(main_frame, tk.Frame):
-            raise TypeError('main_frame should be of type tkinter.Frame')
-        self._main_frame = main_frame
+        """
+        force_empty = tuple((a, b)
+                            for a in range(max(i - 1, 0), min(i + 2, self.x))
+                            for b in range(max(j - 1, 0), min(j + 2, self.y)))
+        if self.x * self.y - len(force_empty) < self.z:
+            force_empty = ((i, j),) if self.x * self.y > self.z else ()
+        self.field.place_mines(force_empty)
+        self.started = True
+
+    def _right_click(self, event):
+        """Dispatch right click on the board canvas to the clicked Tile."""
+        tile = self._tile_at(event)
+        if tile is not None:
+            tile.right_click(event)
+
+    def _display(self, fields):
+        """Display values of given fields in a single pass.
+
+        Args:
+            fields (list of tuple of int): Coordinates of fields to display.
 
-    @property
-    def score_frame(self):
-        return self._score_frame
+        """
+        state = self.field.state
+        for i, j in fields:
+            self.board[i][j].switch(state[i][j])
 
-    @score_frame.setter
-    def score_frame(self, score_frame):
-        if not isinstance(score_frame, tk.Frame):
-            raise TypeError('score_frame should be of type tkinter.Frame')
-        self._score_frame = score_frame
+    def uncover_all(self):
+        """Uncover all covered fields.
 
-    @property
-    def board_frame(self):
-        return self._board_frame
+        Tiles are redrawn in one batch when Tk is next idle.
 
-    @board_frame.setter
-    def board_frame(self, board_frame):
-        if not isinstance(board_frame, tk.Frame):
-            raise TypeError('board_frame should be of type tkinter.Frame')
-        self._board_frame = board_frame
+        """
+        self.canvas.after_idle(self._display, self.field.reveal_all())
 
-    @property
-    def status_frame(self):
-        return self._status_frame
+    def pack(self, *args, **kwargs):
+        self.main_frame.pack(*args, **kwargs)
 
-    @status_frame.setter
-    def status_frame(self, status_frame):
-        if not isinstance(status_frame, tk.Frame):
-            raise TypeError('status_frame should be of type tkinter.Frame')
-        self._status_frame = status_frame
+    def grid(self, *args, **kwargs):
+        self.main_frame.grid(*args, **kwargs)
 
 
 # %%
 
-root = tk.Tk()
-root.title('Minesweeper')
-game1 = Minesweeper(root, 10, 10, 10, True)
-game1.pack()
-root.mainloop()
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title('Minesweeper')
+    game1 = Minesweeper(root, 10, 10, 10)
+    game1.pack()
+    root.mainloop()
 
 # %%